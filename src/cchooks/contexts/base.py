@@ -3,42 +3,105 @@
 import json
 import sys
 from abc import ABC, abstractmethod
-from typing import Any, Dict, NoReturn, Optional, TextIO
+from typing import Any, Callable, Dict, List, NoReturn, Optional, TextIO
 
 from ..exceptions import ParseError
 from ..types import CompleteOutput, HookEventType, CommonOutput
 
 
+def _select_dumps() -> Callable[[Any], bytes]:
+    """Pick the fastest available compact JSON serializer.
+
+    Prefers orjson (the optional `fast` extra), then ujson, and falls back to
+    a single reusable stdlib JSONEncoder. All of them return UTF-8 bytes.
+    """
+    encode = json.JSONEncoder(separators=(",", ":")).encode
+
+    def _json_dumps(obj: Any) -> bytes:
+        return encode(obj).encode()
+
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        orjson_dumps = orjson.dumps
+        orjson_error = orjson.JSONEncodeError
+
+        def _orjson_dumps(obj: Any) -> bytes:
+            try:
+                return orjson_dumps(obj)
+            except orjson_error:
+                # orjson rejects lone surrogates (e.g. from os.fsdecode or a
+                # "\udcff" escape on stdin); the stdlib escapes them instead.
+                return _json_dumps(obj)
+
+        return _orjson_dumps
+
+    try:
+        import ujson
+    except ImportError:
+        pass
+    else:
+
+        def _ujson_dumps(obj: Any) -> bytes:
+            return ujson.dumps(obj, escape_forward_slashes=False).encode()
+
+        return _ujson_dumps
+
+    return _json_dumps
+
+
+# Hook outputs are emitted through a single compact encoder, chosen once.
+_dumps = _select_dumps()
+
+_REQUIRED_COMMON_FIELDS = frozenset(
+    {"session_id", "transcript_path", "hook_event_name"}
+)
+
+# Continue-flow skeletons indexed by the suppress_output flag.
+_CONTINUE_FLOW = (
+    {"continue": True, "stopReason": "stopReason", "suppressOutput": False},
+    {"continue": True, "stopReason": "stopReason", "suppressOutput": True},
+)
+
+
 class BaseHookContext(ABC):
     """Base class for all hook contexts."""
 
+    __slots__ = (
+        "_input_data",
+        "_missing_fields",
+        "session_id",
+        "transcript_path",
+        "hook_event_name",
+    )
+
     def __init__(self, input_data: Dict[str, Any]) -> None:
         """Initialize the context with parsed input data."""
         self._input_data = input_data
-        self._missing_fields: list[str] = []
+        # Allocated only once a required field turns out to be missing.
+        self._missing_fields: Optional[List[str]] = None
         self._validate_common_fields()
+        # Subclasses raise on missing fields once their own validation runs.
+        if not self._missing_fields:
+            self.session_id: str = str(input_data["session_id"])
+            self.transcript_path: str = str(input_data["transcript_path"])
+            hook_event_name = str(input_data["hook_event_name"])
+            self.hook_event_name: HookEventType = hook_event_name  # type: ignore
 
     def _validate_common_fields(self) -> None:
         """Validate fields common to all hook types."""
-        required_fields = ["session_id", "transcript_path", "hook_event_name"]
-        for field in required_fields:
-            if field not in self._input_data:
-                self._missing_fields.append(field)
-
-    @property
-    def session_id(self) -> str:
-        """Get the session ID."""
-        return str(self._input_data["session_id"])
-
-    @property
-    def transcript_path(self) -> str:
-        """Get the transcript file path."""
-        return str(self._input_data["transcript_path"])
+        missing = _REQUIRED_COMMON_FIELDS - self._input_data.keys()
+        if missing:
+            self._add_missing_fields(*sorted(missing))
 
-    @property
-    def hook_event_name(self) -> HookEventType:
-        """Get the hook event name."""
-        return str(self._input_data["hook_event_name"])  # type: ignore
+    def _add_missing_fields(self, *fields: str) -> None:
+        """Record required fields that are absent from the input."""
+        if self._missing_fields is None:
+            self._missing_fields = list(fields)
+        else:
+            self._missing_fields.extend(fields)
 
     @classmethod
     def from_stdin(cls, stdin: TextIO = sys.stdin) -> "BaseHookContext":
@@ -63,6 +126,8 @@ class BaseHookContext(ABC):
 class BaseHookOutput(ABC):
     """Base class for all hook outputs."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Initialize the output handler."""
         # self.base_json = base_json
@@ -72,11 +137,8 @@ class BaseHookOutput(ABC):
         self, suppress_output: bool = False, system_message: Optional[str] = None
     ) -> CommonOutput:
         """Construct Json with continue is true"""
-        result = {
-            "continue": True,
-            "stopReason": "stopReason",
-            "suppressOutput": suppress_output,
-        }
+        # Copy, since callers add decision and hook-specific fields in place.
+        result = dict(_CONTINUE_FLOW[bool(suppress_output)])
         if system_message is not None:
             result["systemMessage"] = system_message
         return result
@@ -107,6 +169,25 @@ class BaseHookOutput(ABC):
         }
         return common_output
 
+    def _emit(self, output: CompleteOutput) -> None:
+        """Write JSON output to stdout as a single line."""
+        self._emit_raw(_dumps(output) + b"\n")
+
+    def _emit_raw(self, line: bytes) -> None:
+        """Write an already-encoded JSON line to stdout."""
+        stdout = sys.stdout
+        buffer = getattr(stdout, "buffer", None)
+        if buffer is None:
+            # Text-only replacements such as io.StringIO
+            stdout.write(line.decode())
+        else:
+            # Keep ordering with text already written through print()
+            stdout.flush()
+            buffer.write(line)
+            # print() on a line-buffered (tty) stdout made the line visible
+            if getattr(stdout, "line_buffering", False):
+                buffer.flush()
+
     def _success(self, message: Optional[str] = None) -> NoReturn:
         """Exit with success (exit code 0)."""
         if message:
@@ -19,11 +19,11 @@ class NotificationContext(BaseHookContext):
         required_fields = ["message", "cwd"]
         for field in required_fields:
             if field not in self._input_data:
-                self._missing_fields.append(field)
+                self._add_missing_fields(field)
 
         if self._missing_fields:
             raise HookValidationError(
-                f"Missing required fields: {', '.join(self._missing_fields)}"
+                "Missing required fields: " + ", ".join(self._missing_fields)
             )
 
     @property
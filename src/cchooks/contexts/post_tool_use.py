@@ -1,7 +1,5 @@
 """PostToolUse hook context and output."""
 
-import json
-import sys
 from typing import Any, Dict, NoReturn, Optional
 
 from .base import BaseHookContext, BaseHookOutput
@@ -22,11 +20,12 @@ class PostToolUseContext(BaseHookContext):
         required_fields = ["tool_name", "tool_input", "tool_response", "cwd"]
         for field in required_fields:
             if field not in self._input_data:
-                self._missing_fields.append(field)
+                self._add_missing_fields(field)
 
         if self._missing_fields:
             raise HookValidationError(
-                f"Missing required PostToolUse fields: {', '.join(self._missing_fields)}"
+                "Missing required PostToolUse fields: "
+                + ", ".join(self._missing_fields)
             )
 
         if not isinstance(self._input_data["tool_input"], dict):
@@ -74,7 +73,7 @@ class PostToolUseOutput(BaseHookOutput):
             system_message (Optional[str]): Optional warning message shown to the user (default: None)
         """
         output = self._continue_flow(suppress_output, system_message)
-        print(json.dumps(output), file=sys.stdout)
+        self._emit(output)
 
     def challenge(
         self,
@@ -90,8 +89,9 @@ class PostToolUseOutput(BaseHookOutput):
             system_message (Optional[str]): Optional warning message shown to the user (default: None)
         """
         output = self._continue_flow(suppress_output, system_message)
-        output.update({"decision": "block", "reason": reason})
-        print(json.dumps(output), file=sys.stdout)
+        output["decision"] = "block"
+        output["reason"] = reason
+        self._emit(output)
 
     def ignore(
         self, suppress_output: bool = False, system_message: Optional[str] = None
@@ -103,7 +103,7 @@ class PostToolUseOutput(BaseHookOutput):
             system_message (Optional[str]): Optional warning message shown to the user (default: None)
         """
         output = self._continue_flow(suppress_output, system_message)
-        print(json.dumps(output), file=sys.stdout)
+        self._emit(output)
 
     def add_context(
         self,
@@ -129,7 +129,7 @@ class PostToolUseOutput(BaseHookOutput):
         output = self._with_specific_output(
             output, "PostToolUse", **hook_specific_output
         )
-        print(json.dumps(output), file=sys.stdout)
+        self._emit(output)
 
     def halt(
         self,
@@ -145,8 +145,9 @@ class PostToolUseOutput(BaseHookOutput):
             system_message (Optional[str]): Optional warning message shown to the user (default: None)
         """
         output = self._stop_flow(reason, suppress_output, system_message)
-        output.update({"decision": "block", "reason": ""})
-        print(json.dumps(output), file=sys.stdout)
+        output["decision"] = "block"
+        output["reason"] = ""
+        self._emit(output)
 
     def exit_success(self, message: Optional[str] = None) -> NoReturn:
         """Exit with success (exit code 0).
@@ -20,11 +20,11 @@ class PreCompactContext(BaseHookContext):
         required_fields = ["trigger", "custom_instructions"]
         for field in required_fields:
             if field not in self._input_data:
-                self._missing_fields.append(field)
+                self._add_missing_fields(field)
 
         if self._missing_fields:
             raise HookValidationError(
-                f"Missing required PreCompact fields: {', '.join(self._missing_fields)}"
+                "Missing required PreCompact fields: " + ", ".join(self._missing_fields)
             )
 
     @property
@@ -1,12 +1,12 @@
 """PreToolUse hook context and output."""
 
-import json
-import sys
 from typing import Any, Dict, NoReturn, Optional
 
 from .base import BaseHookContext, BaseHookOutput
 from ..exceptions import HookValidationError
 
+_REQUIRED_PRE_TOOL_USE_FIELDS = frozenset({"tool_name", "tool_input", "cwd"})
+
 
 class PreToolUseContext(BaseHookContext):
     """Context for PreToolUse hooks."""
@@ -15,37 +15,24 @@ class PreToolUseContext(BaseHookContext):
         """Initialize PreToolUse context."""
         super().__init__(input_data)
         self._validate_pre_tool_use_fields()
+        self.tool_name: str = str(input_data["tool_name"])
+        self.tool_input: Dict[str, Any] = dict(input_data["tool_input"])
+        self.cwd: str = str(input_data["cwd"])
 
     def _validate_pre_tool_use_fields(self) -> None:
         """Validate PreToolUse-specific fields."""
-        required_fields = ["tool_name", "tool_input", "cwd"]
-        for field in required_fields:
-            if field not in self._input_data:
-                self._missing_fields.append(field)
+        missing = _REQUIRED_PRE_TOOL_USE_FIELDS - self._input_data.keys()
+        if missing:
+            self._add_missing_fields(*sorted(missing))
 
         if self._missing_fields:
             raise HookValidationError(
-                f"Missing required PreToolUse fields: {', '.join(self._missing_fields)}"
+                "Missing required PreToolUse fields: " + ", ".join(self._missing_fields)
             )
 
         if not isinstance(self._input_data["tool_input"], dict):
             raise HookValidationError("tool_input must be a JSON object")
 
-    @property
-    def tool_name(self) -> str:
-        """Get the tool name."""
-        return str(self._input_data["tool_name"])  # type: ignore
-
-    @property
-    def tool_input(self) -> Dict[str, Any]:
-        """Get the tool input parameters."""
-        return dict(self._input_data["tool_input"])
-
-    @property
-    def cwd(self) -> str:
-        """Get the current working directory."""
-        return str(self._input_data["cwd"])
-
     @property
     def output(self) -> "PreToolUseOutput":
         """Get the PreToolUse-specific output handler."""
@@ -75,7 +62,7 @@ class PreToolUseOutput(BaseHookOutput):
             permissionDecision="allow",
             permissionDecisionReason=reason,
         )
-        print(json.dumps(output), file=sys.stdout)
+        self._emit(output)
 
     def deny(
         self,
@@ -97,7 +84,7 @@ class PreToolUseOutput(BaseHookOutput):
             permissionDecision="deny",
             permissionDecisionReason=reason,
         )
-        print(json.dumps(output), file=sys.stdout)
+        self._emit(output)
 
     def ask(
         self,
@@ -119,7 +106,7 @@ class PreToolUseOutput(BaseHookOutput):
             permissionDecision="ask",
             permissionDecisionReason=reason,
         )
-        print(json.dumps(output), file=sys.stdout)
+        self._emit(output)
 
     def halt(
         self,
@@ -135,7 +122,7 @@ class PreToolUseOutput(BaseHookOutput):
             system_message (Optional[str]): Optional warning message shown to the user (default: None)
         """
         output = self._stop_flow(reason, suppress_output, system_message)
-        print(json.dumps(output), file=sys.stdout)
+        self._emit(output)
 
     def exit_success(self, message: Optional[str] = None) -> NoReturn:
         """Exit with success (exit code 0).
@@ -30,11 +30,11 @@ class SessionEndContext(BaseHookContext):
         required_fields = ["reason"]
         for field in required_fields:
             if field not in self._input_data:
-                self._missing_fields.append(field)
+                self._add_missing_fields(field)
 
         if self._missing_fields:
             raise HookValidationError(
-                f"Missing required SessionEnd fields: {', '.join(self._missing_fields)}"
+                "Missing required SessionEnd fields: " + ", ".join(self._missing_fields)
             )
 
     @property
@@ -1,7 +1,5 @@
 """SessionStart hook context and output classes."""
 
-import json
-import sys
 from typing import Any, Dict, Optional
 
 from ..exceptions import HookValidationError
@@ -34,11 +32,12 @@ class SessionStartContext(BaseHookContext):
         required_fields = ["source"]
         for field in required_fields:
             if field not in self._input_data:
-                self._missing_fields.append(field)
+                self._add_missing_fields(field)
 
         if self._missing_fields:
             raise HookValidationError(
-                f"Missing required SessionStart fields: {', '.join(self._missing_fields)}"
+                "Missing required SessionStart fields: "
+                + ", ".join(self._missing_fields)
             )
 
     @property
@@ -96,7 +95,7 @@ class SessionStartOutput(BaseHookOutput):
         output = self._with_specific_output(
             output, "SessionStart", **hook_specific_output
         )
-        print(json.dumps(output), file=sys.stdout)
+        self._emit(output)
 
     def exit_success(self, message: Optional[str] = None) -> None:
         """Exit with success (exit code 0).
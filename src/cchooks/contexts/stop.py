@@ -1,45 +1,91 @@
 """Stop hook context and output."""
 
-import json
-import sys
 from typing import Any, Dict, NoReturn, Optional
 
-from .base import BaseHookContext, BaseHookOutput
+from .base import BaseHookContext, BaseHookOutput, _dumps
 from ..exceptions import HookValidationError
+from ..types import CommonOutput
+
+# Sentinel distinguishing an absent key from a falsy value in a single lookup.
+_MISSING = object()
+
+# Placeholder encoded into the response skeletons and swapped for a %s slot.
+_SLOT = "\0slot\0"
+
+
+def _render_template(payload: CommonOutput) -> bytes:
+    """Encode a response skeleton once into a %-template.
+
+    Placeholder values become %s slots, and a final %s slot before the closing
+    brace receives the optional systemMessage member.
+    """
+    encoded = _dumps(payload).replace(b"%", b"%%").replace(_dumps(_SLOT), b"%s")
+    return encoded[:-1] + b"%s}\n"
+
+
+# Pre-rendered StopOutput responses indexed by the suppress_output flag, built
+# from the shared flow helpers so Stop stays in step with the other hooks.
+# Only the string values are JSON-encoded per call.
+_FLOW = BaseHookOutput()
+_HALT_JSON = tuple(
+    _render_template(_FLOW._stop_flow(_SLOT, flag)) for flag in (False, True)
+)
+_PREVENT_JSON = tuple(
+    _render_template(
+        {**_FLOW._continue_flow(flag), "decision": "block", "reason": _SLOT}
+    )
+    for flag in (False, True)
+)
+_ALLOW_JSON = tuple(
+    _render_template(_FLOW._continue_flow(flag)) for flag in (False, True)
+)
+# allow() without a system message is fully static, so serialize it up front.
+_ALLOW_LINES = tuple(template % b"" for template in _ALLOW_JSON)
+
+
+def _system_message_json(system_message: Optional[str]) -> bytes:
+    """Render the optional systemMessage member, including its leading comma."""
+    if system_message is None:
+        return b""
+    return b',"systemMessage":' + _dumps(system_message)
 
 
 class StopContext(BaseHookContext):
     """Context for Stop hooks."""
 
+    __slots__ = ("stop_hook_active", "_output")
+
     def __init__(self, input_data: Dict[str, Any]) -> None:
         """Initialize Stop context."""
         super().__init__(input_data)
         self._validate_stop_fields()
+        self._output = StopOutput()
 
     def _validate_stop_fields(self) -> None:
-        """Validate Stop-specific fields."""
-        if "stop_hook_active" not in self._input_data:
-            self._missing_fields.append("stop_hook_active")
+        """Validate and store Stop-specific fields."""
+        stop_hook_active = self._input_data.get("stop_hook_active", _MISSING)
+        if stop_hook_active is _MISSING:
+            self._add_missing_fields("stop_hook_active")
 
         if self._missing_fields:
             raise HookValidationError(
-                f"Missing required Stop fields: {', '.join(self._missing_fields)}"
+                "Missing required Stop fields: " + ", ".join(self._missing_fields)
             )
 
-    @property
-    def stop_hook_active(self) -> bool:
-        """stop_hook_active is true when Claude Code is already continuing as a result of a stop hook"""
-        return bool(self._input_data["stop_hook_active"])
+        # True when Claude Code is already continuing as a result of a stop hook
+        self.stop_hook_active: bool = bool(stop_hook_active)
 
     @property
     def output(self) -> "StopOutput":
         """Get the Stop-specific output handler."""
-        return StopOutput()
+        return self._output
 
 
 class StopOutput(BaseHookOutput):
     """Output handler for Stop hooks."""
 
+    __slots__ = ()
+
     def halt(
         self,
         stop_reason: str,
@@ -53,8 +99,10 @@ class StopOutput(BaseHookOutput):
             suppress_output (bool): Hide stdout from transcript mode (default: False)
             system_message (Optional[str]): Optional warning message shown to the user (default: None)
         """
-        output = self._stop_flow(stop_reason, suppress_output, system_message)
-        print(json.dumps(output), file=sys.stdout)
+        self._emit_raw(
+            _HALT_JSON[bool(suppress_output)]
+            % (_dumps(stop_reason), _system_message_json(system_message))
+        )
 
     def prevent(
         self,
@@ -69,9 +117,10 @@ class StopOutput(BaseHookOutput):
             suppress_output (bool): Hide stdout from transcript mode (default: False)
             system_message (Optional[str]): Optional warning message shown to the user (default: None)
         """
-        output = self._continue_flow(suppress_output, system_message)
-        output.update({"decision": "block", "reason": reason})
-        print(json.dumps(output), file=sys.stdout)
+        self._emit_raw(
+            _PREVENT_JSON[bool(suppress_output)]
+            % (_dumps(reason), _system_message_json(system_message))
+        )
 
     def allow(
         self, suppress_output: bool = False, system_message: Optional[str] = None
@@ -82,8 +131,13 @@ class StopOutput(BaseHookOutput):
             suppress_output (bool): Hide stdout from transcript mode (default: False)
             system_message (Optional[str]): Optional warning message shown to the user (default: None)
         """
-        output = self._continue_flow(suppress_output, system_message)
-        print(json.dumps(output), file=sys.stdout)
+        if system_message is None:
+            self._emit_raw(_ALLOW_LINES[bool(suppress_output)])
+        else:
+            self._emit_raw(
+                _ALLOW_JSON[bool(suppress_output)]
+                % _system_message_json(system_message)
+            )
 
     def exit_success(self, message: Optional[str] = None) -> NoReturn:
         """Exit with success (exit code 0).
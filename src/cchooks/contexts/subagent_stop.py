@@ -1,7 +1,5 @@
 """SubagentStop hook context and output."""
 
-import json
-import sys
 from typing import Any, Dict, NoReturn, Optional
 
 from .base import BaseHookContext, BaseHookOutput
@@ -19,11 +17,12 @@ class SubagentStopContext(BaseHookContext):
     def _validate_subagent_stop_fields(self) -> None:
         """Validate SubagentStop-specific fields."""
         if "stop_hook_active" not in self._input_data:
-            self._missing_fields.append("stop_hook_active")
+            self._add_missing_fields("stop_hook_active")
 
         if self._missing_fields:
             raise HookValidationError(
-                f"Missing required subagenStop fields: {', '.join(self._missing_fields)}"
+                "Missing required subagenStop fields: "
+                + ", ".join(self._missing_fields)
             )
 
     @property
@@ -54,7 +53,7 @@ class SubagentStopOutput(BaseHookOutput):
             system_message (Optional[str]): Optional warning message shown to the user (default: None)
         """
         output = self._stop_flow(stop_reason, suppress_output, system_message)
-        print(json.dumps(output), file=sys.stdout)
+        self._emit(output)
 
     def prevent(
         self,
@@ -70,8 +69,9 @@ class SubagentStopOutput(BaseHookOutput):
             system_message (Optional[str]): Optional warning message shown to the user (default: None)
         """
         output = self._continue_flow(suppress_output, system_message)
-        output.update({"decision": "block", "reason": reason})
-        print(json.dumps(output), file=sys.stdout)
+        output["decision"] = "block"
+        output["reason"] = reason
+        self._emit(output)
 
     def allow(
         self, suppress_output: bool = False, system_message: Optional[str] = None
@@ -83,7 +83,7 @@ class SubagentStopOutput(BaseHookOutput):
             system_message (Optional[str]): Optional warning message shown to the user (default: None)
         """
         output = self._continue_flow(suppress_output, system_message)
-        print(json.dumps(output), file=sys.stdout)
+        self._emit(output)
 
     def exit_success(self, message: Optional[str] = None) -> NoReturn:
         """Exit with success (exit code 0).
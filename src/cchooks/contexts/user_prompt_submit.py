@@ -1,6 +1,5 @@
 """UserPromptSubmit hook context and output."""
 
-import json
 import sys
 from typing import Any, Dict, NoReturn, Optional
 
@@ -21,11 +20,12 @@ class UserPromptSubmitContext(BaseHookContext):
         required_fields = ["prompt", "cwd"]
         for field in required_fields:
             if field not in self._input_data:
-                self._missing_fields.append(field)
+                self._add_missing_fields(field)
 
         if self._missing_fields:
             raise HookValidationError(
-                f"Missing required UserPromptSubmit fields: {', '.join(self._missing_fields)}"
+                "Missing required UserPromptSubmit fields: "
+                + ", ".join(self._missing_fields)
             )
 
     @property
@@ -58,7 +58,7 @@ class UserPromptSubmitOutput(BaseHookOutput):
         """
         output = self._continue_flow(suppress_output, system_message)
         output = self._with_specific_output(output, "UserPromptSubmit")
-        print(json.dumps(output), file=sys.stdout)
+        self._emit(output)
 
     def block(
         self,
@@ -76,9 +76,10 @@ class UserPromptSubmitOutput(BaseHookOutput):
             system_message (Optional[str]): Optional warning message shown to the user (default: None)
         """
         output = self._continue_flow(suppress_output, system_message)
-        output.update({"decision": "block", "reason": reason})
+        output["decision"] = "block"
+        output["reason"] = reason
         output = self._with_specific_output(output, "UserPromptSubmit")
-        print(json.dumps(output), file=sys.stdout)
+        self._emit(output)
         sys.exit(0)
 
     def add_context(
@@ -98,7 +99,7 @@ class UserPromptSubmitOutput(BaseHookOutput):
         output = self._with_specific_output(
             output, "UserPromptSubmit", additionalContext=context
         )
-        print(json.dumps(output), file=sys.stdout)
+        self._emit(output)
 
     def halt(
         self,
@@ -115,7 +116,7 @@ class UserPromptSubmitOutput(BaseHookOutput):
         """
         output = self._stop_flow(stop_reason, suppress_output, system_message)
         output = self._with_specific_output(output, "UserPromptSubmit")
-        print(json.dumps(output), file=sys.stdout)
+        self._emit(output)
 
     def exit_success(self, message: Optional[str] = None) -> NoReturn:
         """Exit with success (exit code 0).
@@ -8,6 +8,9 @@ import json
 import sys
 from typing import Any, Dict, NoReturn, Optional, TextIO
 
+# Bound once instead of resolving json.dumps and building an encoder per call.
+_encode_json = json.JSONEncoder(ensure_ascii=False).encode
+
 
 def exit_success(message: Optional[str] = None, file: TextIO = sys.stdout) -> NoReturn:
     """Exit with success (exit code 0).
@@ -53,7 +56,7 @@ def output_json(data: Dict[str, Any], file: TextIO = sys.stdout) -> None:
         data: JSON-serializable data to output
         file: Output file (defaults to stdout)
     """
-    print(json.dumps(data, ensure_ascii=False), file=file)
+    file.write(_encode_json(data) + "\n")
 
 
 def handle_parse_error(error: Exception, file: TextIO = sys.stderr) -> NoReturn:
@@ -0,0 +1,48 @@
+"""Tests for the shared JSON serializer in cchooks.contexts.base."""
+
+import sys
+
+import pytest
+
+from cchooks.contexts.base import _select_dumps
+
+PAYLOAD = {"path": "/tmp/café", "ok": True}
+
+
+class TestSelectDumps:
+    """Test each serializer backend picked by _select_dumps."""
+
+    def test_orjson_backend(self):
+        """Test orjson emits compact raw UTF-8."""
+        pytest.importorskip("orjson")
+
+        dumps = _select_dumps()
+
+        assert dumps(PAYLOAD) == '{"path":"/tmp/café","ok":true}'.encode()
+
+    def test_orjson_backend_falls_back_on_lone_surrogates(self):
+        """Test strings orjson rejects are escaped by the stdlib encoder."""
+        pytest.importorskip("orjson")
+
+        dumps = _select_dumps()
+
+        assert dumps({"name": "bad-\udcff"}) == b'{"name":"bad-\\udcff"}'
+
+    def test_ujson_backend(self, monkeypatch):
+        """Test ujson emits compact ASCII without escaping forward slashes."""
+        pytest.importorskip("ujson")
+        monkeypatch.setitem(sys.modules, "orjson", None)
+
+        dumps = _select_dumps()
+
+        assert dumps(PAYLOAD) == b'{"path":"/tmp/caf\\u00e9","ok":true}'
+
+    def test_stdlib_backend(self, monkeypatch):
+        """Test the stdlib fallback emits compact ASCII."""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        monkeypatch.setitem(sys.modules, "ujson", None)
+
+        dumps = _select_dumps()
+
+        assert dumps(PAYLOAD) == b'{"path":"/tmp/caf\\u00e9","ok":true}'
+        assert dumps({"name": "bad-\udcff"}) == b'{"name":"bad-\\udcff"}'
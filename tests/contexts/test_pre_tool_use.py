@@ -402,6 +402,58 @@ class TestPreToolUseOutput:
             assert result["hookSpecificOutput"]["permissionDecisionReason"] == "Please confirm this read operation"
             assert result["systemMessage"] == "ℹ️ This operation requires user confirmation"
 
+    def test_deny_with_lone_surrogate_in_reason(self):
+        """Test deny reasons carrying lone surrogates, e.g. from os.fsdecode."""
+        data = {
+            "session_id": "test-123",
+            "transcript_path": "/tmp/transcript.json",
+            "cwd": "/home/user/project",
+            "hook_event_name": "PreToolUse",
+            "tool_name": "Write",
+            "tool_input": {"file_path": "/tmp/bad-\udcff-name"},
+        }
+
+        context = PreToolUseContext(data)
+        reason = "Refusing to write " + context.tool_input["file_path"]
+
+        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+            context.output.deny(reason)
+
+            result = json.loads(mock_stdout.getvalue().strip())
+
+            assert result["hookSpecificOutput"]["permissionDecision"] == "deny"
+            assert result["hookSpecificOutput"]["permissionDecisionReason"] == reason
+
+    def test_fields_do_not_leak_between_calls(self):
+        """Test fields added by one call are absent from the next."""
+        data = {
+            "session_id": "test-123",
+            "transcript_path": "/tmp/transcript.json",
+            "cwd": "/home/user/project",
+            "hook_event_name": "PreToolUse",
+            "tool_name": "Read",
+            "tool_input": {"file_path": "/tmp/safe.txt"},
+        }
+
+        context = PreToolUseContext(data)
+
+        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+            context.output.deny("Denied", system_message="⚠️ Warning")
+            context.output.allow("Allowed", suppress_output=True)
+            context.output.allow("Allowed")
+
+            lines = mock_stdout.getvalue().strip().splitlines()
+            deny_result, suppressed_result, allow_result = [
+                json.loads(line) for line in lines
+            ]
+
+            assert deny_result["systemMessage"] == "⚠️ Warning"
+            assert "systemMessage" not in suppressed_result
+            assert suppressed_result["suppressOutput"] is True
+            assert "systemMessage" not in allow_result
+            assert allow_result["suppressOutput"] is False
+            assert allow_result["hookSpecificOutput"]["permissionDecision"] == "allow"
+
 
 class TestPreToolUseRealWorldScenarios:
     """Test real-world usage scenarios."""
@@ -1,15 +1,21 @@
 """Tests for StopContext and StopOutput."""
 
 import json
-from io import StringIO
+from io import BufferedWriter, BytesIO, StringIO, TextIOWrapper
 from unittest.mock import patch
 
 import pytest
 
-from cchooks.contexts.stop import StopContext
+from cchooks.contexts.base import BaseHookOutput
+from cchooks.contexts.stop import StopContext, StopOutput
 from cchooks.exceptions import HookValidationError
 
 
+def binary_stdout() -> TextIOWrapper:
+    """Text stream backed by bytes, like the real sys.stdout."""
+    return TextIOWrapper(BytesIO(), encoding="utf-8")
+
+
 class TestStopContext:
     """Test StopContext functionality."""
 
@@ -96,6 +102,34 @@ class TestStopContext:
         assert context.hook_event_name == "Stop"
         assert context.stop_hook_active is True
 
+    def test_output_handler_is_cached(self):
+        """Test the output handler is created once per context."""
+        data = {
+            "hook_event_name": "Stop",
+            "session_id": "test-123",
+            "transcript_path": "/tmp/transcript.json",
+            "stop_hook_active": True,
+        }
+
+        context = StopContext(data)
+
+        assert isinstance(context.output, StopOutput)
+        assert context.output is context.output
+
+    def test_context_and_output_use_slots(self):
+        """Test Stop context and output do not carry a per-instance __dict__."""
+        data = {
+            "hook_event_name": "Stop",
+            "session_id": "test-123",
+            "transcript_path": "/tmp/transcript.json",
+            "stop_hook_active": True,
+        }
+
+        context = StopContext(data)
+
+        assert not hasattr(context, "__dict__")
+        assert not hasattr(context.output, "__dict__")
+
 
 class TestStopOutput:
     """Test StopOutput functionality."""
@@ -156,10 +190,10 @@ class TestStopOutput:
 
         context = StopContext(data)
 
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+        with patch("sys.stdout", new_callable=binary_stdout) as mock_stdout:
             context.output.halt("User requested stop")
 
-            output = mock_stdout.getvalue().strip()
+            output = mock_stdout.buffer.getvalue().decode().strip()
             result = json.loads(output)
 
             assert result["continue"] is False
@@ -177,14 +211,14 @@ class TestStopOutput:
 
         context = StopContext(data)
 
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+        with patch("sys.stdout", new_callable=binary_stdout) as mock_stdout:
             context.output.halt(
                 "User requested stop",
                 suppress_output=False,
                 system_message="⏹️ User initiated stop sequence"
             )
 
-            output = mock_stdout.getvalue().strip()
+            output = mock_stdout.buffer.getvalue().decode().strip()
             result = json.loads(output)
 
             assert result["continue"] is False
@@ -202,10 +236,10 @@ class TestStopOutput:
 
         context = StopContext(data)
 
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+        with patch("sys.stdout", new_callable=binary_stdout) as mock_stdout:
             context.output.prevent("More tasks to complete")
 
-            output = mock_stdout.getvalue().strip()
+            output = mock_stdout.buffer.getvalue().decode().strip()
             result = json.loads(output)
 
             assert result["continue"] is True
@@ -224,14 +258,14 @@ class TestStopOutput:
 
         context = StopContext(data)
 
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+        with patch("sys.stdout", new_callable=binary_stdout) as mock_stdout:
             context.output.prevent(
                 "More tasks to complete",
                 suppress_output=False,
                 system_message="🚫 Stop prevented: Additional tasks remaining"
             )
 
-            output = mock_stdout.getvalue().strip()
+            output = mock_stdout.buffer.getvalue().decode().strip()
             result = json.loads(output)
 
             assert result["continue"] is True
@@ -250,10 +284,10 @@ class TestStopOutput:
 
         context = StopContext(data)
 
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+        with patch("sys.stdout", new_callable=binary_stdout) as mock_stdout:
             context.output.allow()
 
-            output = mock_stdout.getvalue().strip()
+            output = mock_stdout.buffer.getvalue().decode().strip()
             result = json.loads(output)
 
             assert result["continue"] is True
@@ -271,19 +305,239 @@ class TestStopOutput:
 
         context = StopContext(data)
 
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+        with patch("sys.stdout", new_callable=binary_stdout) as mock_stdout:
             context.output.allow(
                 suppress_output=False,
                 system_message="✅ Stop request approved by hook"
             )
 
-            output = mock_stdout.getvalue().strip()
+            output = mock_stdout.buffer.getvalue().decode().strip()
             result = json.loads(output)
 
             assert result["continue"] is True
             assert "decision" not in result
             assert result["systemMessage"] == "✅ Stop request approved by hook"
 
+    def test_allow_with_suppress_output(self):
+        """Test allow method hiding stdout from transcript mode."""
+        data = {
+            "hook_event_name": "Stop",
+            "session_id": "test-123",
+            "transcript_path": "/tmp/transcript.json",
+            "stop_hook_active": True,
+        }
+
+        context = StopContext(data)
+
+        with patch("sys.stdout", new_callable=binary_stdout) as mock_stdout:
+            context.output.allow(suppress_output=True)
+
+            output = mock_stdout.buffer.getvalue().decode().strip()
+            result = json.loads(output)
+
+            assert result["continue"] is True
+            assert result["suppressOutput"] is True
+            assert "decision" not in result
+            assert "systemMessage" not in result
+
+    def test_output_is_compact_json(self):
+        """Test JSON output is emitted without separator whitespace."""
+        data = {
+            "hook_event_name": "Stop",
+            "session_id": "test-123",
+            "transcript_path": "/tmp/transcript.json",
+            "stop_hook_active": False,
+        }
+
+        context = StopContext(data)
+
+        with patch("sys.stdout", new_callable=binary_stdout) as mock_stdout:
+            context.output.prevent("More tasks to complete")
+
+            output = mock_stdout.buffer.getvalue().decode().strip()
+
+            assert '"continue":true' in output
+            assert '"decision":"block"' in output
+
+    def test_system_message_does_not_leak_between_calls(self):
+        """Test a system message from one call is absent from the next."""
+        data = {
+            "hook_event_name": "Stop",
+            "session_id": "test-123",
+            "transcript_path": "/tmp/transcript.json",
+            "stop_hook_active": False,
+        }
+
+        context = StopContext(data)
+
+        with patch("sys.stdout", new_callable=binary_stdout) as mock_stdout:
+            context.output.prevent("First", system_message="⚠️ Warning")
+            context.output.allow(system_message="⚠️ Warning")
+            context.output.prevent("Second", suppress_output=True)
+            context.output.allow()
+
+            lines = mock_stdout.buffer.getvalue().decode().strip().splitlines()
+            results = [json.loads(line) for line in lines]
+
+            assert [r.get("systemMessage") for r in results] == [
+                "⚠️ Warning",
+                "⚠️ Warning",
+                None,
+                None,
+            ]
+            assert results[2]["suppressOutput"] is True
+            assert results[3]["suppressOutput"] is False
+            assert "decision" not in results[3]
+
+    def test_output_falls_back_to_text_only_stdout(self):
+        """Test JSON output when stdout has no underlying binary buffer."""
+        data = {
+            "hook_event_name": "Stop",
+            "session_id": "test-123",
+            "transcript_path": "/tmp/transcript.json",
+            "stop_hook_active": True,
+        }
+
+        context = StopContext(data)
+
+        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+            context.output.halt("User requested stop", system_message="⏹️ Stopping")
+
+            result = json.loads(mock_stdout.getvalue().strip())
+
+            assert result["continue"] is False
+            assert result["stopReason"] == "User requested stop"
+            assert result["systemMessage"] == "⏹️ Stopping"
+
+    def test_output_keeps_order_with_printed_text(self):
+        """Test JSON written to the buffer follows text printed before it."""
+        data = {
+            "hook_event_name": "Stop",
+            "session_id": "test-123",
+            "transcript_path": "/tmp/transcript.json",
+            "stop_hook_active": True,
+        }
+
+        context = StopContext(data)
+
+        with patch("sys.stdout", new_callable=binary_stdout) as mock_stdout:
+            print("before")
+            context.output.allow()
+            print("after")
+            mock_stdout.flush()
+
+            lines = mock_stdout.buffer.getvalue().decode().splitlines()
+
+            assert lines[0] == "before"
+            assert json.loads(lines[1])["continue"] is True
+            assert lines[2] == "after"
+
+    def test_output_matches_shared_flow_helpers(self):
+        """Test Stop responses match the shared flow helpers key-for-key."""
+        data = {
+            "hook_event_name": "Stop",
+            "session_id": "test-123",
+            "transcript_path": "/tmp/transcript.json",
+            "stop_hook_active": True,
+        }
+        flow = BaseHookOutput()
+        reason = "Reason with % and \"quotes\""
+
+        context = StopContext(data)
+
+        for suppress_output in (False, True):
+            for system_message in (None, "⚠️ 100% done"):
+                with patch("sys.stdout", new_callable=binary_stdout) as mock_stdout:
+                    context.output.halt(reason, suppress_output, system_message)
+                    context.output.prevent(reason, suppress_output, system_message)
+                    context.output.allow(suppress_output, system_message)
+
+                    lines = mock_stdout.buffer.getvalue().decode().splitlines()
+                    halt_result, prevent_result, allow_result = [
+                        json.loads(line) for line in lines
+                    ]
+
+                continue_flow = flow._continue_flow(suppress_output, system_message)
+                assert halt_result == flow._stop_flow(
+                    reason, suppress_output, system_message
+                )
+                assert prevent_result == {
+                    **continue_flow,
+                    "decision": "block",
+                    "reason": reason,
+                }
+                assert allow_result == continue_flow
+
+    def test_output_is_flushed_on_line_buffered_stdout(self):
+        """Test JSON is visible immediately when stdout is line-buffered."""
+        data = {
+            "hook_event_name": "Stop",
+            "session_id": "test-123",
+            "transcript_path": "/tmp/transcript.json",
+            "stop_hook_active": True,
+        }
+        raw = BytesIO()
+        stdout = TextIOWrapper(
+            BufferedWriter(raw), encoding="utf-8", line_buffering=True
+        )
+
+        context = StopContext(data)
+
+        with patch("sys.stdout", stdout):
+            context.output.allow()
+
+            result = json.loads(raw.getvalue().decode())
+
+            assert result["continue"] is True
+
+    def test_output_escapes_lone_surrogates(self):
+        """Test reasons carrying lone surrogates, e.g. from os.fsdecode."""
+        data = {
+            "hook_event_name": "Stop",
+            "session_id": "test-123",
+            "transcript_path": "/tmp/transcript.json",
+            "stop_hook_active": True,
+        }
+        reason = "bad-\udcff-name"
+
+        context = StopContext(data)
+
+        with patch("sys.stdout", new_callable=binary_stdout) as mock_stdout:
+            context.output.halt(reason, system_message=reason)
+
+            output = mock_stdout.buffer.getvalue().decode().strip()
+            result = json.loads(output)
+
+            assert "\\udcff" in output
+            assert result["stopReason"] == reason
+            assert result["systemMessage"] == reason
+
+    def test_output_escapes_special_characters(self):
+        """Test reasons and messages with JSON metacharacters round-trip."""
+        data = {
+            "hook_event_name": "Stop",
+            "session_id": "test-123",
+            "transcript_path": "/tmp/transcript.json",
+            "stop_hook_active": True,
+        }
+        reason = 'Quote " backslash \\ newline \n brace } unicode ⏹️'
+
+        context = StopContext(data)
+
+        with patch("sys.stdout", new_callable=binary_stdout) as mock_stdout:
+            context.output.halt(reason, suppress_output=True, system_message=reason)
+            context.output.prevent(reason, system_message=reason)
+
+            lines = mock_stdout.buffer.getvalue().decode().strip().splitlines()
+            halt_result, prevent_result = [json.loads(line) for line in lines]
+
+            assert halt_result["stopReason"] == reason
+            assert halt_result["systemMessage"] == reason
+            assert halt_result["suppressOutput"] is True
+            assert prevent_result["reason"] == reason
+            assert prevent_result["systemMessage"] == reason
+
+
 class TestStopRealWorldScenarios:
     """Test real-world stopping scenarios."""
 
@@ -331,10 +585,10 @@ class TestStopRealWorldScenarios:
         context = StopContext(data)
 
         # Test preventing stop
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+        with patch("sys.stdout", new_callable=binary_stdout) as mock_stdout:
             context.output.prevent("Pending tasks not completed")
 
-            output = mock_stdout.getvalue().strip()
+            output = mock_stdout.buffer.getvalue().decode().strip()
             result = json.loads(output)
             assert result["continue"] is True
             assert "Pending tasks" in result["reason"]
@@ -374,10 +628,10 @@ class TestStopRealWorldScenarios:
                     context.output.exit_success(scenario["reason"])
                     mock_exit.assert_called_once_with(0)
             else:
-                with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+                with patch("sys.stdout", new_callable=binary_stdout) as mock_stdout:
                     context.output.prevent(scenario["reason"])
 
-                    output = mock_stdout.getvalue().strip()
+                    output = mock_stdout.buffer.getvalue().decode().strip()
                     result = json.loads(output)
                     assert result["continue"] is True
 
@@ -430,11 +684,11 @@ class TestStopRealWorldScenarios:
 
             context = StopContext(data)
 
-            with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+            with patch("sys.stdout", new_callable=binary_stdout) as mock_stdout:
                 method = getattr(context.output, scenario["method"])
                 method(scenario["reason"])
 
-                output = mock_stdout.getvalue().strip()
+                output = mock_stdout.buffer.getvalue().decode().strip()
                 result = json.loads(output)
 
                 if scenario["decision"] == "stop":